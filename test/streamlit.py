@@ -1,57 +1,84 @@
 import os
 import time
-import librosa
-import soundfile
+import asyncio
+import numpy as np
 import streamlit as st
 import torch
+from numba import njit
 from io import BytesIO
 import subprocess
 import tempfile
+import hashlib
+import sys
+# Use the voicefixer package from this repo (as test/test.py does) rather
+# than the PyPI release; `streamlit run test/streamlit.py` only puts test/
+# on sys.path, and chunked_restore relies on the in-repo _pre taking tensors
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
 from voicefixer import VoiceFixer
 import shutil
 import logging
-import sys
 from datetime import datetime
 import signal
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 import threading
+import concurrent.futures
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Progress messages for the current run are rendered into a single
+# placeholder (see log_box below) instead of one st.write element each
+log_lines = []
+log_box = None
+
 def log_info(message):
     """Log info message and display in Streamlit"""
     logger.info(message)
-    st.write(message)
+    log_lines.append(f"{datetime.now():%H:%M:%S} {message}")
+    if log_box is None:
+        st.write(message)
+    else:
+        log_box.code("\n".join(log_lines[-20:]), language=None)
 
 class TimeoutError(Exception):
     pass
 
-def run_with_timeout(func, args=(), kwargs={}, timeout_duration=300):
-    """Run a function with a timeout using threading"""
-    result = []
-    error = []
-    
-    def worker():
-        try:
-            result.append(func(*args, **kwargs))
-        except Exception as e:
-            error.append(e)
-    
-    thread = threading.Thread(target=worker)
-    thread.daemon = True
-    thread.start()
-    thread.join(timeout_duration)
-    
-    if thread.is_alive():
-        thread.join(1)  # Give it a second to clean up
+class CancelledError(Exception):
+    pass
+
+@st.cache_resource
+def get_executor():
+    """Single shared worker so reruns and timeouts can't pile up threads"""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="voicefixer")
+
+def run_with_timeout(func, args=(), kwargs={}, timeout_duration=300, on_queued=None):
+    """Run a function on the shared worker with a timeout.
+
+    The worker is shared by every session, so the timeout only starts once
+    the job is picked up; on_queued is called if it has to wait first.
+    func is passed a threading.Event as `cancel_event`, which is set on
+    timeout so it can bail out instead of holding the worker."""
+    started = threading.Event()
+    cancel_event = threading.Event()
+
+    def job():
+        started.set()
+        return func(*args, cancel_event=cancel_event, **kwargs)
+
+    future = get_executor().submit(job)
+    if not started.wait(0.1) and on_queued is not None:
+        on_queued()
+    while not started.wait(1):
+        if future.done():
+            break
+    try:
+        return future.result(timeout=timeout_duration)
+    except concurrent.futures.TimeoutError:
+        cancel_event.set()
         raise TimeoutError("Operation timed out")
-    
-    if error:
-        raise error[0]
-    
-    return result[0] if result else None
 
 # Page configuration
 st.set_page_config(
@@ -60,150 +87,249 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
-    <style>
-    .main {
-        padding: 0 3rem;
-        background-color: #0e1117;
-        color: white;
-        max-width: 1200px;
-        margin: 0 auto;
-    }
-    
-    .hero-section {
-        text-align: center;
-        padding: 3rem 0;
-        margin-bottom: 2rem;
-    }
-    
-    .hero-title {
-        font-size: 3.5rem;
-        font-weight: 700;
-        margin-bottom: 0.5rem;
-        color: white;
-    }
-    
-    .hero-subtitle {
-        font-size: 1.2rem;
-        color: #a0a0a0;
-        margin-bottom: 2rem;
-    }
-    
-    /* File uploader styling */
-    .stFileUploader {
-        width: 100%;
-    }
-    
-    .uploadedFile {
-        display: none;
-    }
-    
-    .stFileUploader > div {
-        background: #1e2127;
-        border-radius: 12px;
-        padding: 4rem 2rem !important;
-        text-align: center;
-        border: 2px dashed #2d3139;
-        color: white;
-    }
-    
-    .stFileUploader > div:hover {
-        border-color: #FFD700;
-        background: #262931;
-        cursor: pointer;
-    }
-    
-    /* Status indicators */
-    .stStatus {
-        background-color: #1e2127 !important;
-        border: 1px solid #2d3139 !important;
-    }
-    
-    /* Download button styling */
-    .stDownloadButton > button {
-        background-color: #FFD700 !important;
-        color: black !important;
-        padding: 1.5rem !important;
-        font-size: 1.2rem !important;
-        font-weight: 600 !important;
-        border: none !important;
-        border-radius: 12px !important;
-        transition: all 0.3s ease !important;
-        width: 100% !important;
-        margin: 2rem 0 !important;
-    }
-    
-    .stDownloadButton > button:hover {
-        background-color: #FFC000 !important;
-        transform: translateY(-2px) !important;
-        box-shadow: 0 5px 15px rgba(255, 215, 0, 0.2) !important;
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    
-    /* Progress bar */
-    .stProgress > div > div > div > div {
-        background-color: #FFD700 !important;
-    }
-    
-    /* Toggle switch styling */
-    .switch-container {
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        gap: 1rem;
-        margin: 1rem 0;
-    }
-    
-    .version-label {
-        color: #a0a0a0;
-        font-size: 1rem;
-    }
-    
-    .version-label.active {
-        color: white;
-        font-weight: 600;
-    }
-    
-    /* Style the toggle switch */
-    .stCheckbox {
-        display: flex;
-        justify-content: center;
-    }
-    
-    .stCheckbox > div {
-        background: transparent !important;
-    }
-    
-    .stCheckbox > div > div > div {
-        background-color: #FFD700 !important;
-    }
-    
-    /* Center video title */
-    .video-title {
-        text-align: center;
-        margin: 2rem 0 1rem 0;
-        color: white;
-        font-size: 1.5rem;
-        font-weight: 600;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+# Custom CSS, kept in a standalone stylesheet
+@st.cache_data
+def load_css():
+    with open(os.path.join(os.path.dirname(__file__), "assets", "style.css")) as f:
+        return f.read()
 
-# Initialize VoiceFixer with error handling
-@st.cache_resource
-def init_voicefixer():
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+USE_CUDA = torch.cuda.is_available()
+# Autocast in bf16 where the GPU supports it (fp32's exponent range, so
+# less overflow risk on the mel features), fp16 otherwise
+AMP_DTYPE = torch.bfloat16 if USE_CUDA and torch.cuda.is_bf16_supported() else torch.float16
+# int8 dynamic quantization changes the restored audio and hasn't been
+# checked against fp32 output yet, so it's opt-in (see README)
+QUANTIZE_CPU = os.environ.get("VOICEBOOST_QUANTIZE_CPU", "0") == "1"
+sample_rate = 44100
+
+# Both kernels are serial on purpose. They are called from more than one
+# thread (the enhancement worker, the model-loader warm-up and each
+# session's script thread), and two parallel regions launched at once can
+# abort the process under numba's default workqueue threading layer. They
+# are single memory-bound passes anyway, and torch already owns the cores
+@njit(fastmath=True, cache=True)
+def oa_accumulate(out, chunk, start, overlap, hop, fade_in, fade_out):
+    """Cross-fade weight a restored window and add it into out in one pass"""
+    for i in range(len(chunk)):
+        gain = 1.0
+        if fade_in and i < overlap:
+            gain = (i + 0.5) / overlap
+        elif fade_out and i >= hop:
+            gain = 1.0 - (i - hop + 0.5) / overlap
+        out[start + i] += chunk[i] * gain
+
+@njit(fastmath=True, cache=True)
+def to_pcm16(audio):
+    """Clip float audio to [-1, 1] and scale it to int16 in one pass"""
+    pcm = np.empty(len(audio), dtype=np.int16)
+    for i in range(len(audio)):
+        pcm[i] = np.int16(min(max(audio[i], -1.0), 1.0) * 32767)
+    return pcm
+
+def pad_window(chunk, win):
+    """Reflect-pad a short tail window up to the full window length.
+
+    Keeps every model call at the one shape compiled during warm-up;
+    reflection rather than zeros because mode 2 runs BatchNorm in train
+    mode, so padding feeds into the normalisation statistics."""
+    if len(chunk) >= win:
+        return chunk
+    return np.pad(chunk, (0, win - len(chunk)), mode='reflect' if len(chunk) > 1 else 'edge')
+
+def chunked_restore(vf, audio, sr=sample_rate, win=None, hop=None, mode=2, cancel_event=None):
+    """Restore audio in overlapping windows and cross-fade the overlaps.
+
+    Keeps peak memory proportional to the window instead of the file."""
+    win = win or 10 * sr
+    hop = hop or 9 * sr
+    overlap = win - hop
+    out = np.zeros(len(audio), dtype=np.float32)
+
+    def vocoder(mel):
+        # Under autocast the vocoder returns bf16/fp16, and restore_inmem
+        # ends in .numpy(), which has no bfloat16
+        return vf._model.vocoder(mel, cuda=USE_CUDA).float()
+
+    if USE_CUDA:
+        # Stage the audio in pinned memory and upload each window on a side
+        # stream while the previous one is still being restored
+        pinned = torch.empty(len(audio), dtype=torch.float32, pin_memory=True)
+        pinned.numpy()[:] = audio
+        xfer_stream = torch.cuda.Stream()
+
+        def upload(start):
+            src = pinned[start:start + win]
+            if len(src) < win:
+                src = torch.from_numpy(pad_window(audio[start:], win)).pin_memory()
+            with torch.cuda.stream(xfer_stream):
+                return src.to('cuda', non_blocking=True)
+
+        next_chunk = upload(0)
+
+    start = 0
+    while True:
+        if cancel_event is not None and cancel_event.is_set():
+            raise CancelledError("Enhancement cancelled")
+        is_last = start + win >= len(audio)
+        n = min(win, len(audio) - start)
+        if USE_CUDA:
+            torch.cuda.current_stream().wait_stream(xfer_stream)
+            chunk = next_chunk
+            chunk.record_stream(torch.cuda.current_stream())
+            if not is_last:
+                next_chunk = upload(start + hop)
+        else:
+            chunk = pad_window(audio[start:start + win], win)
+        restored = vf.restore_inmem(chunk, mode=mode, cuda=USE_CUDA, your_vocoder_func=vocoder)
+        # Drop the tail padding; restore_inmem can also trim a few samples
+        restored = restored.astype(np.float32, copy=False).reshape(-1)[:n]
+        oa_accumulate(out, restored, start, overlap, hop, start > 0, not is_last)
+        if is_last:
+            return out
+        start += hop
+
+def enhance_audio(vf, audio, mode=2, cancel_event=None):
+    """Run VoiceFixer, on the GPU under autocast when one is available"""
+    # Grad/autocast state is thread-local, so it has to be set up here
+    # rather than around run_with_timeout
+    amp = torch.autocast('cuda', dtype=AMP_DTYPE) if USE_CUDA else nullcontext()
+    with torch.inference_mode(), amp:
+        return chunked_restore(vf, audio, mode=mode, cancel_event=cancel_event)
+
+def quantize_voicefixer(vf):
+    """Swap the restorer's Linear/GRU layers for dynamic int8 versions on CPU"""
     try:
-        return VoiceFixer()
+        vf._model = torch.ao.quantization.quantize_dynamic(
+            vf._model.eval(), {torch.nn.Linear, torch.nn.GRU}, dtype=torch.qint8
+        )
     except Exception as e:
-        st.error(f"Error initializing VoiceFixer: {str(e)}")
-        return None
+        logger.warning(f"Dynamic quantization unavailable, keeping fp32 weights: {str(e)}")
+    return vf
 
-voice_fixer = init_voicefixer()
-sample_rate = 44100
+def compile_voicefixer(vf):
+    """JIT-compile the restorer network and pay the compile cost up front"""
+    try:
+        vf._model = torch.compile(
+            vf._model,
+            mode='reduce-overhead' if USE_CUDA else 'default',
+            fullgraph=False,
+        )
+        # Compilation is lazy, so push exactly one full chunked_restore
+        # window of silence through the same code path the app uses
+        enhance_audio(vf, np.zeros(10 * sample_rate, dtype=np.float32))
+    except Exception as e:
+        logger.warning(f"torch.compile unavailable, using eager mode: {str(e)}")
+        vf._model = getattr(vf._model, '_orig_mod', vf._model)
+    return vf
+
+# Initialize VoiceFixer once per server. This runs on the get_loader()
+# thread alongside the first audio extraction, so it must not touch the page
+@st.cache_resource(show_spinner=False)
+def init_voicefixer():
+    vf = VoiceFixer()
+    if USE_CUDA:
+        vf._model.to('cuda').eval()
+    elif QUANTIZE_CPU:
+        vf = quantize_voicefixer(vf)
+    return compile_voicefixer(vf)
+
+# Explicit thread counts so ffmpeg neither idles nor oversubscribes
+# container vCPUs; leaves the other half for torch
+FFMPEG_THREADS = str(max(1, (os.cpu_count() or 2) // 2))
+
+def ffmpeg_command(*args):
+    """Build an ffmpeg command line capped at FFMPEG_THREADS.
+
+    -threads is per-stream: before the first -i it only limits that
+    input's decoder, so it's repeated just before the output path (the
+    last argument) to limit the encoder too."""
+    *options, output = args
+    return [
+        'ffmpeg', '-filter_threads', FFMPEG_THREADS,
+        '-threads', FFMPEG_THREADS, *options,
+        '-threads', FFMPEG_THREADS, output,
+    ]
+
+async def run_ffmpeg(*args, input=None):
+    """Run ffmpeg without blocking the event loop and return its stdout.
+
+    input is any contiguous buffer; it is written to stdin in 64 KiB
+    slices, so it never gets copied into the pipe transport's buffer
+    wholesale the way proc.communicate(input) would."""
+    proc = await asyncio.create_subprocess_exec(
+        *ffmpeg_command(*args),
+        stdin=asyncio.subprocess.DEVNULL if input is None else asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    async def feed_stdin():
+        if input is None:
+            return
+        view = memoryview(input).cast('B')
+        try:
+            for i in range(0, len(view), 65536):
+                proc.stdin.write(view[i:i + 65536])
+                await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # ffmpeg exited early; its stderr says why
+        finally:
+            proc.stdin.close()
+
+    _, out, err = await asyncio.gather(feed_stdin(), proc.stdout.read(), proc.stderr.read())
+    await proc.wait()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(
+            proc.returncode, ['ffmpeg', *args], stderr=err.decode(errors='replace')
+        )
+    return out
+
+@st.cache_resource(show_spinner=False)
+def ffmpeg_has_soxr():
+    """Whether this ffmpeg build ships the SIMD soxr resampler"""
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-buildconf'],
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return '--enable-libsoxr' in result.stdout
+
+# Reruns on the same upload (e.g. after a widget change) skip ffmpeg.
+# Kept in memory only, so uploaded audio never lands in the disk cache.
+# One entry only: a 100 MB upload can decode to ~100 MB+ of float32 PCM
+# (10 min at 44.1 kHz is ~106 MB), and cache_data holds a pickled copy
+# plus a fresh unpickled copy per hit, so this bounds it to roughly
+# 2x one file's PCM
+@st.cache_data(show_spinner=False, max_entries=1, ttl=3600)
+def extract_pcm(video_hash, _input_video_path):
+    """Decode the video's audio track straight into mono float32 PCM.
+
+    Cached on the upload's SHA-256; the path is left out of the key."""
+    # Prefer soxr over ffmpeg's default swr resampler when available
+    resample = ['-af', 'aresample=resampler=soxr'] if ffmpeg_has_soxr() else []
+    args = [
+        '-i', _input_video_path,
+        '-vn', '-sn', '-dn', '-f', 'f32le', '-acodec', 'pcm_f32le',
+        *resample,
+        '-ar', str(sample_rate), '-ac', '1',
+        '-'
+    ]
+    result = subprocess.run(
+        ffmpeg_command(*args),
+        stdin=subprocess.DEVNULL, capture_output=True,
+    )
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            result.returncode, result.args, stderr=result.stderr.decode(errors='replace')
+        )
+    return np.frombuffer(result.stdout, dtype=np.float32)
+
+@st.cache_resource
+def get_loader():
+    """Background thread that loads VoiceFixer while the audio is extracted"""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="voicefixer-load")
 
 # Hero Section
 st.markdown("""
@@ -213,14 +339,28 @@ st.markdown("""
     </div>
     """, unsafe_allow_html=True)
 
+# Keep in sync with server.maxUploadSize in .streamlit/config.toml, which
+# makes Streamlit refuse larger uploads before they're buffered in memory
+MAX_FILE_SIZE = 100 * 1024 * 1024  # 100 MB
+
 # File Upload Section
 video_file = st.file_uploader(
     "Drop your video here",
     type=["mp4", "mov"],
     key="video_uploader",
-    help="Maximum file size: 200MB",
+    help="Maximum file size: 100MB",
 )
 
+def scratch_dir(file_size):
+    """Pick RAM-backed /dev/shm for intermediates when it has room.
+
+    Docker caps /dev/shm at 64 MB by default, so fall back to the regular
+    temp dir unless there's space for the input, the output and headroom."""
+    shm = '/dev/shm'
+    if os.path.isdir(shm) and shutil.disk_usage(shm).free > 3 * file_size:
+        return shm
+    return tempfile.gettempdir()
+
 def check_ffmpeg_installed():
     """Check if ffmpeg is available in the system."""
     if not shutil.which('ffmpeg'):
@@ -240,13 +380,12 @@ def check_ffmpeg_installed():
 if not video_file:
     st.markdown("""
         <div style='text-align: center; color: #a0a0a0; font-size: 0.9rem; margin-top: -1rem;'>
-        Drag and drop or click to browse • MP4 or MOV • Up to 200MB
+        Drag and drop or click to browse • MP4 or MOV • Up to 100MB
         </div>
         """, unsafe_allow_html=True)
 else:
-    # Add file size check
-    MAX_FILE_SIZE = 100 * 1024 * 1024  # 100 MB
-    file_size = len(video_file.getvalue())
+    # Check the size UploadedFile reports before touching its bytes
+    file_size = video_file.size
     if file_size > MAX_FILE_SIZE:
         st.error(f"File too large. Maximum size is 100 MB. Your file is {file_size / (1024*1024):.1f} MB")
         st.stop()
@@ -261,27 +400,29 @@ else:
         # Processing Section
         with st.status("Enhancing your video...", expanded=True) as status:
             start_time = datetime.now()
+            log_box = st.empty()
             log_info("⚡ Starting video enhancement process...")
-            log_info(f"Input video size: {len(video_file.getvalue()) / (1024*1024):.2f} MB")
+            log_info(f"Input video size: {file_size / (1024*1024):.2f} MB")
             
-            with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = tempfile.mkdtemp(prefix="voiceboost-", dir=scratch_dir(file_size))
+            try:
                 # Save uploaded video
                 input_video_path = os.path.join(temp_dir, f"input.{video_file.name.split('.')[-1]}")
+                video_file.seek(0)
                 with open(input_video_path, 'wb') as f:
-                    f.write(video_file.getvalue())
+                    shutil.copyfileobj(video_file, f, length=65536)
+                with video_file.getbuffer() as buf:
+                    video_hash = hashlib.sha256(buf).hexdigest()
                 progress_bar.progress(10)
                 
-                # Extract audio
+                # Extract audio straight into memory as mono float32 PCM,
+                # overlapped with loading the model on the first run
                 log_info("🎵 Extracting audio from video...")
-                input_audio_path = os.path.join(temp_dir, "input.wav")
                 try:
-                    result = subprocess.run([
-                        'ffmpeg', '-i', input_video_path,
-                        '-vn', '-acodec', 'pcm_s16le',
-                        '-ar', str(sample_rate), '-ac', '1',
-                        input_audio_path
-                    ], check=True, capture_output=True, text=True)
+                    model_future = get_loader().submit(init_voicefixer)
+                    audio = extract_pcm(video_hash, input_video_path)
                     log_info("✅ Audio extraction complete")
+                    voice_fixer = model_future.result()
                 except subprocess.CalledProcessError as e:
                     log_info(f"❌ FFmpeg error output: {e.stderr}")
                     st.error(f"Error processing video: {e.stderr}")
@@ -296,16 +437,16 @@ else:
                 # Process audio
                 log_info("✨ Applying AI enhancement...")
                 try:
-                    audio, _ = librosa.load(input_audio_path, sr=sample_rate, mono=True)
                     log_info(f"Audio loaded successfully. Shape: {audio.shape}")
                     
                     try:
                         # Run enhancement with timeout
                         enhanced_audio = run_with_timeout(
-                            voice_fixer.restore_inmem,
-                            args=(audio,),
-                            kwargs={'mode': 2, 'cuda': False},
-                            timeout_duration=300
+                            enhance_audio,
+                            args=(voice_fixer, audio),
+                            kwargs={'mode': 2},
+                            timeout_duration=300,
+                            on_queued=lambda: log_info("⏳ Waiting for another video to finish enhancing..."),
                         )
                         log_info("✅ AI enhancement complete")
                     except TimeoutError:
@@ -327,30 +468,25 @@ else:
                 
                 progress_bar.progress(60)
                 
-                # Save enhanced audio
-                log_info("💾 Saving enhanced audio...")
-                output_audio_path = os.path.join(temp_dir, "enhanced.wav")
-                try:
-                    soundfile.write(output_audio_path, enhanced_audio.T, samplerate=sample_rate)
-                    log_info("✅ Enhanced audio saved successfully")
-                except Exception as e:
-                    log_info(f"❌ Error saving enhanced audio: {str(e)}")
-                    st.error(f"Error saving enhanced audio: {str(e)}")
-                    st.stop()
-                
-                progress_bar.progress(80)
-                
-                # Merge with video
+                # Merge with video, feeding the enhanced audio to ffmpeg as
+                # raw 16-bit PCM on stdin
                 log_info("🎬 Creating final enhanced video...")
                 output_video_path = os.path.join(temp_dir, f"enhanced_{video_file.name}")
                 try:
-                    result = subprocess.run([
-                        'ffmpeg', '-i', input_video_path,
-                        '-i', output_audio_path,
+                    # enhanced_audio is already flat mono, so no transpose is
+                    # needed; run_ffmpeg streams the int16 buffer to stdin in slices
+                    pcm = to_pcm16(enhanced_audio).astype('<i2', copy=False)
+                    progress_bar.progress(80)
+                    asyncio.run(run_ffmpeg(
+                        '-i', input_video_path,
+                        '-f', 's16le', '-ar', str(sample_rate), '-ac', '1',
+                        '-i', 'pipe:0',
                         '-c:v', 'copy', '-c:a', 'aac',
                         '-map', '0:v:0', '-map', '1:a:0',
-                        output_video_path
-                    ], check=True, capture_output=True, text=True)
+                        '-movflags', '+faststart',
+                        output_video_path,
+                        input=pcm,
+                    ))
                     log_info("✅ Video merging complete")
                 except subprocess.CalledProcessError as e:
                     log_info(f"❌ Error merging video: {e.stderr}")
@@ -382,14 +518,19 @@ else:
                 # Download Section - centered
                 col1, col2, col3 = st.columns([1,2,1])
                 with col2:
+                    # download_button reads the whole handle into memory
+                    # (Streamlit 1.41 marshall_file does seek(0) + read()),
+                    # so this costs one full-video allocation either way
                     with open(output_video_path, 'rb') as f:
                         st.download_button(
                             label="⬇️ Download Enhanced Video",
-                            data=f.read(),
+                            data=f,
                             file_name=f"enhanced_{video_file.name}",
                             mime=f"video/{video_file.name.split('.')[-1]}",
                             use_container_width=True,
                         )
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
     except Exception as e:
         log_info(f"❌ Fatal error: {str(e)}")
         st.error(f"An unexpected error occurred: {str(e)}")
@@ -77,7 +77,8 @@ class VoiceFixer(nn.Module):
 
     def _pre(self, model, input, cuda):
         input = input[None, None, ...]
-        input = torch.tensor(input)
+        if not torch.is_tensor(input):
+            input = torch.tensor(input)
         input = try_tensor_cuda(input, cuda=cuda)
         sp, _, _ = model.f_helper.wav_to_spectrogram_phase(input)
         mel_orig = model.mel(sp.permute(0, 1, 3, 2)).permute(0, 1, 3, 2)